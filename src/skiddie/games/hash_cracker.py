@@ -18,12 +18,14 @@ You should have received a copy of the GNU General Public License
 along with skiddie.  If not, see <http://www.gnu.org/licenses/>.
 """
 import random
-from typing import List, Set, Iterable
+import functools
+from typing import List, Iterable, Sequence, Optional, Tuple
 
 from prompt_toolkit.validation import Validator
 from prompt_toolkit import PromptSession
 
 from skiddie.constants import GUI_STYLE
+from skiddie.utils.counting import count_bits
 from skiddie.utils.ui import print_correct_message
 
 # The string that prefixes every line in the grid.
@@ -32,6 +34,12 @@ PREFIX_STRING = "0x"
 # The string of characters that may be used in the grid.
 VALID_CHARS = "0123456789abcdef"
 
+# The number of times to try shuffling the valid characters into a new row of the grid before searching for one instead.
+MAX_ROW_SHUFFLES = 10
+
+# The maximum number of bitmasks to remember the set bits of.
+BIT_CACHE_SIZE = 4096
+
 # A list of possible usernames to be used for formatting the output.
 USERNAMES = [
     "lostatc", "root", "daemon", "bin", "sys", "sync", "games", "man", "mail", "news", "uucp", "proxy", "www-data",
@@ -44,80 +52,204 @@ USERNAMES = [
 class CharGrid:
     """Represent a grid of characters.
 
+    The grid is stored as a flat array of cells in row-major order. Each cell holds the index of its character in
+    `char_sequence`, so a row is a contiguous slice of the array and a column is a strided slice.
+
+    Args:
+        valid_chars: The characters that are allowed in the grid. There can be no more than 256 of them.
+        num_columns: The number of columns in the grid.
+
     Attributes:
-        valid_chars: The string of characters that are allowed in the grid.
         num_columns: The number of columns in the grid.
-        rows: The grid represented as a list of rows. Each row contains a list of characters.
+        char_sequence: The valid characters in the order they were given with duplicates removed. The character at
+            index `i` is represented by the bit `1 << i` in a bitmask.
+        char_bits: A map of each valid character to the bit which represents it in a bitmask.
+        all_mask: A bitmask with the bit set for every valid character.
+        _cells: The index in `char_sequence` of the character in each cell of the grid.
+        _char_indices: A map of each valid character to its index in `char_sequence`.
+        _column_masks: A bitmask for each column with the bits set for the characters used in that column.
     """
     def __init__(self, valid_chars: Iterable, num_columns: int) -> None:
-        self.valid_chars = set(valid_chars)
         self.num_columns = num_columns
-        self.rows = []
+        self.char_sequence = tuple(dict.fromkeys(valid_chars))
+        self.char_bits = {char: 1 << i for i, char in enumerate(self.char_sequence)}
+        self.all_mask = (1 << len(self.char_sequence)) - 1
+        self._cells = bytearray()
+        self._char_indices = {char: i for i, char in enumerate(self.char_sequence)}
+        self._column_masks = [0] * num_columns
 
-    @property
-    def columns(self) -> List[List[str]]:
-        """The columns of the grid.
-
-        Ignore rows which aren't full.
-        """
-        full_rows = [row for row in self.rows if len(row) == self.num_columns]
-        return [list(chars) for chars in zip(*full_rows)]
+        if len(self.char_sequence) > 256:
+            raise ValueError("a grid cannot have more than 256 valid characters")
 
     @property
-    def unused_row(self) -> List[Set[str]]:
-        """The characters that are unused in each row.
-
-        Returns:
-            A list containing a set of characters for each row.
-        """
-        return [self.valid_chars - set(chars) for chars in self.rows]
+    def num_rows(self) -> int:
+        """The number of rows in the grid."""
+        return len(self._cells) // self.num_columns
 
     @property
-    def unused_column(self) -> List[Set[str]]:
-        """The characters that are unused in each column.
+    def rows(self) -> List[str]:
+        """The rows of the grid."""
+        return [
+            self._decode(self._cells[start:start + self.num_columns])
+            for start in range(0, len(self._cells), self.num_columns)
+        ]
 
-        Returns:
-            A list containing a set of characters for each column.
-        """
-        # If not all columns exist, pad the list.
-        output = [self.valid_chars - set(chars) for chars in self.columns]
-        output += [self.valid_chars] * (self.num_columns - len(output))
-        return output
+    def _decode(self, cells: bytes) -> str:
+        """Return the characters in the given cells as a string."""
+        return "".join(self.char_sequence[index] for index in cells)
 
-    def format(self) -> str:
-        """Format the grid as a single string."""
-        return "\n".join("".join(row) for row in self.rows)
-
-    def is_valid(self) -> bool:
-        """The grid is valid.
+    def check_row(self, row: str) -> bool:
+        """Return whether the given row would be valid if added to the grid, and add it if it would.
 
-        Every row is full and there are no repeating characters in any row or column.
+        The rest of the grid is assumed to be valid, so only the given row is checked against the existing columns. The
+        row is valid if it is full and contains only valid characters that are not repeated in the row or its columns.
         """
-        for row in self.rows:
-            if len(row) != self.num_columns:
-                return False
-            elif len(set(row)) < len(row):
-                return False
+        if len(row) != self.num_columns:
+            return False
 
-        for column in self.columns:
-            if len(set(column)) < len(column):
+        row_mask = 0
+        for column_num, char in enumerate(row):
+            bit = self.char_bits.get(char, 0)
+            if not bit & ~row_mask & ~self._column_masks[column_num]:
                 return False
+            row_mask |= bit
 
-        return True
+        self.add_row(row)
 
-    def check_row(self, row: str) -> bool:
-        """Return whether the given row would be valid if added to the grid."""
-        self.rows.append(row)
-        if not self.is_valid():
-            self.rows.pop()
-            return False
         return True
 
+    def add_row(self, row: Sequence[str]) -> None:
+        """Add a full row to the bottom of the grid without checking whether it is valid."""
+        indices = [self._char_indices[char] for char in row]
+        self._cells.extend(indices)
+
+        for column_num, index in enumerate(indices):
+            self._column_masks[column_num] |= 1 << index
+
+    def unused_mask(self, column_num: int) -> int:
+        """Return a bitmask of the characters that are not used in the given column."""
+        return self.all_mask & ~self._column_masks[column_num]
+
+    def get_char(self, bit: int) -> str:
+        """Return the valid character which is represented by the given bit."""
+        return self.char_sequence[bit.bit_length() - 1]
+
+    def fits_column(self, char: str, column_num: int) -> bool:
+        """Return whether the given character is unused in the given column."""
+        return not self._column_masks[column_num] & self.char_bits[char]
+
+
+@functools.lru_cache(maxsize=BIT_CACHE_SIZE)
+def get_bits(mask: int) -> Tuple[int, ...]:
+    """Return each of the bits that is set in the given bitmask, from lowest to highest."""
+    bits = []
+    while mask:
+        bit = mask & -mask
+        bits.append(bit)
+        mask ^= bit
+    return tuple(bits)
+
+
+def choose_bit(mask: int) -> int:
+    """Randomly select one of the bits that is set in the given bitmask.
+
+    Raises:
+        IndexError: No bits are set in the bitmask.
+    """
+    return random.choice(get_bits(mask))
+
+
+def _shuffle_row(char_grid: CharGrid) -> Optional[List[str]]:
+    """Try to generate a new row for the grid by shuffling the valid characters.
+
+    Characters which are already used in their column are swapped with other characters in the row where possible.
+
+    Returns:
+        The new row, or None if a valid row couldn't be generated.
+    """
+    num_columns = char_grid.num_columns
+
+    for _ in range(MAX_ROW_SHUFFLES):
+        row = random.sample(char_grid.char_sequence, num_columns)
+
+        for i in range(num_columns):
+            if char_grid.fits_column(row[i], i):
+                continue
+
+            # Swap this character with one from a random position where both characters fit in their new column.
+            for j in random.sample(range(num_columns), num_columns):
+                if char_grid.fits_column(row[j], i) and char_grid.fits_column(row[i], j):
+                    row[i], row[j] = row[j], row[i]
+                    break
+            else:
+                break
+        else:
+            return row
+
+    return None
+
+
+def _search_row(char_grid: CharGrid) -> List[str]:
+    """Generate a new row for the grid by backtracking through the characters that could go in each position.
+
+    The position with the fewest characters that could go in it is always filled next, which prunes the search much
+    sooner than filling the positions from left to right.
+
+    Returns:
+        The new row.
+
+    Raises:
+        ValueError: There is no valid row that could be added to the grid.
+    """
+    row_bits = [0] * char_grid.num_columns
+    row_mask = 0
+
+    # Each decision on the trail is the position that was filled and a bitmask of the characters which haven't been
+    # tried in that position yet.
+    trail = []
+
+    while len(trail) < char_grid.num_columns:
+        # Find the unfilled positions with the fewest characters that could go in them.
+        best_positions = []
+        best_count = None
+        for column_num, bit in enumerate(row_bits):
+            if bit:
+                continue
+
+            candidates = char_grid.unused_mask(column_num) & ~row_mask
+            count = count_bits(candidates)
+            if best_count is None or count < best_count:
+                best_positions = [(column_num, candidates)]
+                best_count = count
+            elif count == best_count:
+                best_positions.append((column_num, candidates))
+
+        column_num, candidates = random.choice(best_positions)
+
+        # There are no characters that will work. Backtrack to the most recent decision which still has characters
+        # left to try.
+        while not candidates:
+            if not trail:
+                raise ValueError("there is no valid row that could be added to the grid")
+
+            column_num, candidates = trail.pop()
+            row_mask ^= row_bits[column_num]
+            row_bits[column_num] = 0
+
+        bit = choose_bit(candidates)
+        row_bits[column_num] = bit
+        row_mask |= bit
+        trail.append((column_num, candidates ^ bit))
+
+    return [char_grid.get_char(bit) for bit in row_bits]
+
 
 def create_grid(rows: int, columns: int, valid_chars: str = VALID_CHARS) -> CharGrid:
     """Generate a random grid of characters.
 
-    The same character will not appear more than once in any row or column.
+    The same character will not appear more than once in any row or column. Each row is generated by shuffling the
+    valid characters, which almost always produces a valid row on the first few tries. If it doesn't, the row is found
+    by searching instead.
 
     Args:
         rows: The number of rows in the grid.
@@ -129,33 +261,12 @@ def create_grid(rows: int, columns: int, valid_chars: str = VALID_CHARS) -> Char
     """
     char_grid = CharGrid(valid_chars, columns)
 
-    while len(char_grid.rows) < rows:
-        char_grid.rows.append([])
-        row_num = len(char_grid.rows) - 1
-        current_row = char_grid.rows[-1]
-
-        # These are characters that have been tried and found to not work. They are stored in this list to prevent the
-        # algorithm from selecting them a second time.
-        invalid_row_chars = [set() for _ in range(columns)]
-
-        while len(current_row) < columns:
-            column_num = len(current_row) - 1
-            try:
-                # Randomly select a character from the set of characters that are not in either the current column or
-                # row and haven't already been found to not work.
-                char = random.choice(list(
-                    (char_grid.unused_column[column_num + 1] & char_grid.unused_row[row_num])
-                    - invalid_row_chars[column_num + 1]
-                ))
-            except IndexError:
-                # There are no characters that will work. Backtrack to the previous position in the row and try a
-                # different character.
-                invalid_row_chars[column_num].add(current_row.pop())
-                for chars in invalid_row_chars[column_num+1:]:
-                    # When a character changes, the set of invalid characters for subsequent positions must be cleared.
-                    chars.clear()
-            else:
-                current_row.append(char)
+    while char_grid.num_rows < rows:
+        new_row = _shuffle_row(char_grid)
+        if new_row is None:
+            new_row = _search_row(char_grid)
+
+        char_grid.add_row(new_row)
 
     return char_grid
 
@@ -195,8 +306,8 @@ def play(rows_to_win: int, starting_rows: int, columns: int) -> None:
 
     # Format and print the initial grid.
     starting_grid = "\n".join(
-        format_line(usernames.pop(), pad_width, line)
-        for line in char_grid.format().splitlines()
+        format_line(usernames.pop(), pad_width, row)
+        for row in char_grid.rows
     )
     print(starting_grid)
 
@@ -205,7 +316,7 @@ def play(rows_to_win: int, starting_rows: int, columns: int) -> None:
     session = PromptSession(validator=validator, validate_while_typing=False, mouse_support=True, style=GUI_STYLE)
 
     # Prompt the user until they complete enough lines.
-    while len(char_grid.rows) < rows_to_win:
+    while char_grid.num_rows < rows_to_win:
         session.prompt(format_line(usernames.pop(), pad_width, ""))
 
     print_correct_message()
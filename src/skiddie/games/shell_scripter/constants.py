@@ -20,35 +20,68 @@ along with skiddie.  If not, see <http://www.gnu.org/licenses/>.
 from skiddie.games.shell_scripter.logic import Command, Argument
 
 # Directory paths to be used as arguments in commands.
-ARG_DIR_PATHS = [
+ARG_DIR_PATHS = (
     "~/Documents", "/home/lostatc/Documents", "~/Downloads", "/home/lostatc/Downloads", "~/Music",
     "/home/lostatc/Music", "~/Pictures", "/home/lostatc/Pictures", "~/Videos", "/home/lostatc/Videos", ".", "/", "/dev",
     "/dev/mapper", "/etc", "/etc/sysconfig", "/home/lostatc", "/mnt", "/proc", "/run", "/run/media/lostatc", "/sys",
     "/tmp", "/usr/share", "/usr/local/share", "/var", "/var/log",
-]
+)
 
 # Shell globing patterns for matching file names to be used as arguments in commands.
-ARG_FILE_GLOB_PATTERNS = [
+ARG_FILE_GLOB_PATTERNS = (
     "\".*\"", "\"*.png\"", "\"*.flac\"", "\"*.log\"", "\"*.pid\"", "\"*.rst\"", "\"*.tar.*\"", "\"*.py[cod]\"",
     "\"*.od[tspgf]\"", "*.og[gvaxm]", "\"*.doc[xm]\"", "\"*.xls[xm]\"", "\"backup.tar-[a-z][a-z]\"",
-]
+)
 
 # Delimiters to be used as arguments in commands.
-ARG_DELIMITERS = [
+ARG_DELIMITERS = (
     "\" \"", "\",\"", "\"-\"", "\"_\"", "\"|\"", "\":\"", "\"\\n\"", "\"\\0\"",
-]
+)
+
+# Small numbers, starting at zero, to be used as arguments in commands.
+ARG_NUMBERS_0_5 = ("0", "1", "2", "3", "4", "5")
+
+# Small numbers, starting at one, to be used as arguments in commands.
+ARG_NUMBERS_1_5 = ("1", "2", "3", "4", "5")
+
+# Numbers of lines of context to be used as arguments in commands.
+ARG_CONTEXT_LINES = ("1", "2", "3", "4", "5", "10")
+
+# Numbers of lines of context to be used as arguments in diff commands.
+ARG_DIFF_CONTEXT_LINES = ("0", "1", "2", "4", "5", "6", "7", "8", "9", "10")
+
+# Numbers of minutes to be used as arguments in commands.
+ARG_MINUTES = ("1", "2", "3", "4", "5", "10", "15", "20", "25", "30", "60", "120")
 
-# The list of possible names of files that can be used for data input.
-INPUT_FILE_NAMES = [
+# Numbers of bytes to be used as arguments in commands.
+ARG_BYTE_COUNTS = ("64", "128", "256", "512", "1K", "2K", "3K", "4K", "1M")
+
+# Numbers of lines to be used as arguments in commands.
+ARG_LINE_COUNTS = ("1", "2", "3", "4", "5", "15", "\"-15\"", "20", "\"-20\"", "25", "\"-25\"")
+
+# Settings for when to use color to be used as arguments in commands.
+ARG_COLOR_WHEN = ("never", "always", "auto")
+
+# Backup control methods to be used as arguments in commands.
+ARG_BACKUP_CONTROLS = ("none", "off", "numbered", "existing", "nil", "simple", "never")
+
+# Backup file suffixes to be used as arguments in commands.
+ARG_BACKUP_SUFFIXES = ("\".bak\"", "\".backup\"", "\".old\"", "\".orig\"")
+
+# File attributes to be used as arguments in commands.
+ARG_PRESERVED_ATTRIBUTES = ("mode", "ownership", "timestamps", "context", "links", "xattr", "all")
+
+# The possible names of files that can be used for data input.
+INPUT_FILE_NAMES = (
     "input.txt", "input_file.txt", "in.txt", "origin.txt", "source.txt", "src.txt", "data.txt", "beginning.txt",
     "start.txt", "info.txt",
-]
+)
 
-# The list of possible names of files that can be used for data output.
-OUTPUT_FILE_NAMES = [
+# The possible names of files that can be used for data output.
+OUTPUT_FILE_NAMES = (
     "output.txt", "output_file.txt", "out.txt", "result.txt", "destination.txt", "dest.txt", "file.txt", "end.txt",
     "finish.txt", "dump.txt",
-]
+)
 
 COMMANDS = (
     Command(
@@ -66,10 +99,10 @@ COMMANDS = (
             Argument(["-v", "--invert-match"], []),
             Argument(["-x", "--line-regexp"], []),
             Argument(["-c", "--count"], []),
-            Argument(["--color"], ["never", "always", "auto"]),
-            Argument(["-m", "--max-count"], ["1", "2", "3", "4", "5"]),
-            Argument(["-A", "--after-context"], ["1", "2", "3", "4", "5", "10"]),
-            Argument(["-B", "--before-context"], ["1", "2", "3", "4", "5", "10"]),
+            Argument(["--color"], ARG_COLOR_WHEN),
+            Argument(["-m", "--max-count"], ARG_NUMBERS_1_5),
+            Argument(["-A", "--after-context"], ARG_CONTEXT_LINES),
+            Argument(["-B", "--before-context"], ARG_CONTEXT_LINES),
             Argument(["--exclude"], ARG_FILE_GLOB_PATTERNS),
             Argument(["--include"], ARG_FILE_GLOB_PATTERNS),
             Argument(["-r", "--recursive"], []),
@@ -82,16 +115,16 @@ COMMANDS = (
             Argument([], ARG_DIR_PATHS),
         ], [
             Argument(["-depth"], []),
-            Argument(["-maxdepth"], ["0", "1", "2", "3", "4", "5"]),
-            Argument(["-mindepth"], ["0", "1", "2", "3", "4", "5"]),
+            Argument(["-maxdepth"], ARG_NUMBERS_0_5),
+            Argument(["-mindepth"], ARG_NUMBERS_0_5),
             Argument(["-mount"], []),
-            Argument(["-amin"], ["1", "2", "3", "4", "5", "10", "15", "20", "25", "30", "60", "120"]),
-            Argument(["-cmin"], ["1", "2", "3", "4", "5", "10", "15", "20", "25", "30", "60", "120"]),
+            Argument(["-amin"], ARG_MINUTES),
+            Argument(["-cmin"], ARG_MINUTES),
             Argument(["-empty"], []),
             Argument(["-gid"], ["0", "10", "100", "99", "1000", "1001", "1002", "1003"]),
             Argument(["-group"], ["root", "lostatc", "wheel", "nobody", "users"]),
-            Argument(["-links"], ["0", "1", "2", "3", "4", "5"]),
-            Argument(["-mmin"], ["1", "2", "3", "4", "5", "10", "15", "20", "25", "30", "60", "120"]),
+            Argument(["-links"], ARG_NUMBERS_0_5),
+            Argument(["-mmin"], ARG_MINUTES),
             Argument(["-name"], ARG_FILE_GLOB_PATTERNS),
             Argument(["-perm"], ["\"/a+w\"", "\"-g+w\"", "\"u=w\"", "\"-a+r\"", "\"/a+x\"", "\"-220\""]),
             Argument(["-size"], ["50K", "100K", "120K", "1M", "50M", "100M", "200M", "1G", "2G", "3G"]),
@@ -116,7 +149,7 @@ COMMANDS = (
             Argument(["-s", "--size"], []),
             Argument(["-R", "--recursive"], []),
             Argument(["--quoting-style"], ["literal", "locale", "shell", "shell-always", "shell-escape", "shell-escape-always", "c", "escape"]),
-            Argument(["--color"], ["always", "auto", "never"]),
+            Argument(["--color"], ARG_COLOR_WHEN),
             Argument(["--format"], ["across", "commas", "horizontal", "long", "single-column", "verbose", "vertical"]),
         ],
         redirect_output=True,
@@ -162,8 +195,8 @@ COMMANDS = (
     ),
     Command(
         "head", [], [
-            Argument(["-c", "--bytes"], ["64", "128", "256", "512", "1K", "2K", "3K", "4K", "1M"]),
-            Argument(["-n", "--lines"], ["1", "2", "3", "4", "5", "15", "\"-15\"", "20", "\"-20\"", "25", "\"-25\""]),
+            Argument(["-c", "--bytes"], ARG_BYTE_COUNTS),
+            Argument(["-n", "--lines"], ARG_LINE_COUNTS),
             Argument(["-q", "--quiet", "--silent"], []),
             Argument(["-z", "--zero-terminated"], []),
         ],
@@ -172,9 +205,9 @@ COMMANDS = (
     ),
     Command(
         "tail", [], [
-            Argument(["-c", "--bytes"], ["64", "128", "256", "512", "1K", "2K", "3K", "4K", "1M"]),
+            Argument(["-c", "--bytes"], ARG_BYTE_COUNTS),
             Argument(["-f", "--follow"], ["name", "descriptor"]),
-            Argument(["-n", "--lines"], ["1", "2", "3", "4", "5", "15", "\"-15\"", "20", "\"-20\"", "25", "\"-25\""]),
+            Argument(["-n", "--lines"], ARG_LINE_COUNTS),
             Argument(["--pid"], ["451", "1984", "24601", "666", "6022", "3141", "2718", "1414", "1618"]),
             Argument(["-q", "--quiet", "--silent"], []),
             Argument(["--retry"], []),
@@ -206,8 +239,8 @@ COMMANDS = (
         ], [
             Argument(["-q", "--brief"], []),
             Argument(["-s", "--report-identical-files"], []),
-            Argument(["-c", "-C", "--context"], ["0", "1", "2", "4", "5", "6", "7", "8", "9", "10"]),
-            Argument(["-u", "-U", "--unified"], ["0", "1", "2", "4", "5", "6", "7", "8", "9", "10"]),
+            Argument(["-c", "-C", "--context"], ARG_DIFF_CONTEXT_LINES),
+            Argument(["-u", "-U", "--unified"], ARG_DIFF_CONTEXT_LINES),
             Argument(["-y", "--side-by-side"], []),
             Argument(["-W", "--width"], ["64", "72", "80", "100", "120", "200"]),
             Argument(["--tabsize"], ["1", "2", "4"]),
@@ -216,7 +249,7 @@ COMMANDS = (
             Argument(["-x", "--exclude"], ARG_FILE_GLOB_PATTERNS),
             Argument(["-i", "--ignore-case"], []),
             Argument(["-a", "--text"], []),
-            Argument(["--color"], ["never", "always", "auto"]),
+            Argument(["--color"], ARG_COLOR_WHEN),
         ],
         redirect_output=True,
     ),
@@ -256,7 +289,7 @@ COMMANDS = (
             Argument(["-c", "--count"], []),
             Argument(["-d", "--repeated"], []),
             Argument(["--all-repeated"], ["none", "prepend", "separate"]),
-            Argument(["-f", "--skip-fields"], ["1", "2", "3", "4", "5"]),
+            Argument(["-f", "--skip-fields"], ARG_NUMBERS_1_5),
             Argument(["--group"], ["separate", "prepend", "append", "both"]),
             Argument(["-i", "--ignore-case"], []),
             Argument(["-s", "--skip-chars"], ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]),
@@ -272,12 +305,12 @@ COMMANDS = (
             Argument([], INPUT_FILE_NAMES),
             Argument([], OUTPUT_FILE_NAMES),
         ], [
-            Argument(["--backup"], ["none", "off", "numbered", "existing", "nil", "simple", "never"]),
+            Argument(["--backup"], ARG_BACKUP_CONTROLS),
             Argument(["-f", "--force"], []),
             Argument(["-i", "--interactive"], []),
             Argument(["-n", "--no-clobber"], []),
             Argument(["--strip-trailing-slashes"], []),
-            Argument(["-S", "--suffix"], ["\".bak\"", "\".backup\"", "\".old\"", "\".orig\""]),
+            Argument(["-S", "--suffix"], ARG_BACKUP_SUFFIXES),
             Argument(["-u", "--update"], []),
         ],
     ),
@@ -287,19 +320,19 @@ COMMANDS = (
             Argument([], OUTPUT_FILE_NAMES),
         ], [
             Argument(["-a", "--archive"], []),
-            Argument(["--backup"], ["none", "off", "numbered", "exiting", "nil", "simple", "never"]),
+            Argument(["--backup"], ARG_BACKUP_CONTROLS),
             Argument(["-f", "--force"], []),
             Argument(["-i", "--interactive"], []),
             Argument(["-L", "--dereference"], []),
             Argument(["-n", "--no-clobber"], []),
             Argument(["-P", "--no-dereference"], []),
-            Argument(["--preserve"], ["mode", "ownership", "timestamps", "context", "links", "xattr", "all"]),
-            Argument(["--no-preserve"], ["mode", "ownership", "timestamps", "context", "links", "xattr", "all"]),
+            Argument(["--preserve"], ARG_PRESERVED_ATTRIBUTES),
+            Argument(["--no-preserve"], ARG_PRESERVED_ATTRIBUTES),
             Argument(["-r", "-R", "--recursive"], []),
             Argument(["--reflink"], ["always", "auto"]),
             Argument(["--sparse"], ["always", "auto", "never"]),
             Argument(["-s", "--symbolic-link"], []),
-            Argument(["-S", "--suffix"], ["\".bak\"", "\".backup\"", "\".old\"", "\".orig\""]),
+            Argument(["-S", "--suffix"], ARG_BACKUP_SUFFIXES),
             Argument(["-u", "--update"], []),
             Argument(["-x", "--one-file-system"], []),
         ],
@@ -18,28 +18,45 @@ You should have received a copy of the GNU General Public License
 along with skiddie.  If not, see <http://www.gnu.org/licenses/>.
 """
 import random
-from typing import List
+from typing import Sequence, Optional
+
+# The format strings used to redirect the output of a command to a file.
+OUTPUT_REDIRECT_FORMATS = ("{0} > {1}", "{0} >> {1}")
+
+# The maximum number of commands that can be piped to or from a command in a single direction. Commands at this depth
+# redirect to or from a file instead.
+MAX_PIPE_DEPTH = 8
 
 
 class Argument:
     """An argument to a shell command.
 
     Attributes:
-        names: A list of possible names for the argument.
-        values: A list of possible values for the argument.
+        names: A tuple of possible names for the argument.
+        values: A tuple of possible values for the argument.
     """
-    def __init__(self, names: List[str], values: List[str]) -> None:
-        self.names = names
-        self.values = values
+    __slots__ = ("names", "values")
 
-    def get_random(self) -> str:
+    def __init__(self, names: Sequence[str], values: Sequence[str]) -> None:
+        self.names = tuple(names)
+        self.values = tuple(values)
+
+    def get_random(self, random_source: random.Random) -> str:
         """Generate a random argument within the given constraints as a string.
 
+        Args:
+            random_source: The source of randomness to use.
+
         Returns:
             The argument as a string.
         """
-        # Don't print the separator if either the list of names or list of values are empty.
-        return " ".join(random.choice(choices) for choices in (self.names, self.values) if choices)
+        # Don't print the separator if either the names or values are empty.
+        if not self.values:
+            return random_source.choice(self.names) if self.names else ""
+        elif not self.names:
+            return random_source.choice(self.values)
+        else:
+            return "{0} {1}".format(random_source.choice(self.names), random_source.choice(self.values))
 
 
 class Command:
@@ -47,19 +64,21 @@ class Command:
 
     Attributes:
         name: The name of the command.
-        positional_args: A list of required positional arguments for the command. Each command in this list is used once
-            in the order that it appears.
-        optional_args: A list of optional arguments for the command. Commands in this list are chosen randomly and can
-            be used in any order.
+        positional_args: A tuple of required positional arguments for the command. Each command in this tuple is used
+            once in the order that it appears.
+        optional_args: A tuple of optional arguments for the command. Commands in this tuple are chosen randomly and
+            can be used in any order.
         redirect_output: The command can redirect its output.
         redirect_input: The command must redirect its input.
     """
+    __slots__ = ("name", "positional_args", "optional_args", "redirect_output", "redirect_input")
+
     def __init__(
-            self, name: str, positional_args: List[Argument], optional_args: List[Argument],
+            self, name: str, positional_args: Sequence[Argument], optional_args: Sequence[Argument],
             redirect_output: bool = False, redirect_input: bool = False) -> None:
         self.name = name
-        self.positional_args = positional_args
-        self.optional_args = optional_args
+        self.positional_args = tuple(positional_args)
+        self.optional_args = tuple(optional_args)
         self.redirect_output = redirect_output
         self.redirect_input = redirect_input
 
@@ -67,6 +86,10 @@ class Command:
 class CommandGenerator:
     """A class that generates random command strings.
 
+    Args:
+        random_source: The source of randomness used to generate commands. Pass a seeded instance to get reproducible
+            output. If this is not given, a new instance is created.
+
     Attributes:
         commands: The commands to choose from.
         input_names: The names of files used as sources of input.
@@ -75,10 +98,14 @@ class CommandGenerator:
         max_args: The maximum number of non-required arguments that a command can have.
         redirect_probability: The probability that a command will send its output to a pipe or file.
         pipe_probability: The probability that a command will use a pipe when redirecting its output.
+        _command_pools: A map of each combination of whether a command must redirect its input and whether it can
+            redirect its output to the commands which match it.
+        _random_source: The source of randomness used to generate commands.
     """
     def __init__(
-            self, commands: List[Command], input_names: List[str], output_names: List[str],
-            min_args: int, max_args: int, redirect_probability: float, pipe_probability: float) -> None:
+            self, commands: Sequence[Command], input_names: Sequence[str], output_names: Sequence[str],
+            min_args: int, max_args: int, redirect_probability: float, pipe_probability: float,
+            random_source: Optional[random.Random] = None) -> None:
         self.commands = commands
         self.input_names = input_names
         self.output_names = output_names
@@ -86,10 +113,19 @@ class CommandGenerator:
         self.max_args = max_args
         self.redirect_probability = redirect_probability
         self.pipe_probability = pipe_probability
+        self._random_source = random.Random() if random_source is None else random_source
+        self._command_pools = {
+            (supports_input, supports_output): tuple(
+                command for command in commands
+                if command.redirect_input == supports_input and command.redirect_output == supports_output
+            )
+            for supports_input in (True, False)
+            for supports_output in (True, False)
+        }
 
     def get_random(
             self, redirect_input: bool = True, redirect_output: bool = True,
-            supports_input: bool = True, supports_output: bool = True) -> str:
+            supports_input: bool = True, supports_output: bool = True, depth: int = 0) -> str:
         """Generate a random command string within the given constraints.
 
         Args:
@@ -97,66 +133,64 @@ class CommandGenerator:
             redirect_output: Have a chance of adding random output redirection to the command string.
             supports_input: Only return a command that supports input redirection.
             supports_output: Only return a command that supports output redirection.
+            depth: The number of commands that have been piped to reach this one.
 
         Returns:
             The command as a string.
         """
-        available_commands = [
-            command for command in self.commands
-            if command.redirect_input == supports_input and command.redirect_output == supports_output
-        ]
-        command = random.choice(available_commands)
-
-        selected_args = command.positional_args.copy()
-        remaining_args = command.optional_args.copy()
+        command = self._random_source.choice(self._command_pools[supports_input, supports_output])
 
         # Select random parameters.
         if self.max_args == 0:
             number_of_args = 0
         else:
-            number_of_args = random.randrange(self.min_args, self.max_args)
+            number_of_args = min(
+                self._random_source.randrange(self.min_args, self.max_args), len(command.optional_args)
+            )
 
-        # Add a random number of optional arguments.
-        random.shuffle(remaining_args)
-        for _ in range(number_of_args):
-            try:
-                selected_args.append(remaining_args.pop())
-            except IndexError:
-                break
+        # Add a random number of optional arguments after the positional ones.
+        if number_of_args == 0:
+            selected_args = command.positional_args
+        else:
+            selected_args = command.positional_args + tuple(
+                self._random_source.sample(command.optional_args, number_of_args)
+            )
 
         # Generate a command string.
         if not selected_args:
             command_string = command.name
         else:
-            command_string = "{0} {1}".format(command.name, " ".join(arg.get_random() for arg in selected_args))
+            command_string = "{0} {1}".format(
+                command.name, " ".join([arg.get_random(self._random_source) for arg in selected_args])
+            )
 
         # Add random redirects to the command string.
         if command.redirect_input and redirect_input:
-            command_string = self._add_input_redirection(command_string)
-        if command.redirect_output and redirect_output and random.random() < self.redirect_probability:
-            command_string = self._add_output_redirection(command_string)
+            command_string = self._add_input_redirection(command_string, depth)
+        if command.redirect_output and redirect_output and self._random_source.random() < self.redirect_probability:
+            command_string = self._add_output_redirection(command_string, depth)
 
         return command_string
 
-    def _add_input_redirection(self, command_string: str) -> str:
+    def _add_input_redirection(self, command_string: str, depth: int) -> str:
         """Add random input redirection to the given command string."""
-        if random.random() < self.pipe_probability:
+        if depth < MAX_PIPE_DEPTH and self._random_source.random() < self.pipe_probability:
             return "{0} | {1}".format(
-                self.get_random(redirect_output=False, supports_output=True),
+                self.get_random(redirect_output=False, supports_output=True, depth=depth + 1),
                 command_string
             )
         else:
-            return "{0} < {1}".format(command_string, random.choice(self.input_names))
+            return "{0} < {1}".format(command_string, self._random_source.choice(self.input_names))
 
-    def _add_output_redirection(self, command_string: str) -> str:
+    def _add_output_redirection(self, command_string: str, depth: int) -> str:
         """Add random output redirection to the given command string."""
-        if random.random() < self.pipe_probability:
+        if depth < MAX_PIPE_DEPTH and self._random_source.random() < self.pipe_probability:
             return "{0} | {1}".format(
                 command_string,
-                self.get_random(redirect_input=False, supports_input=True)
+                self.get_random(redirect_input=False, supports_input=True, depth=depth + 1)
             )
         else:
-            return random.choice(["{0} > {1}", "{0} >> {1}"]).format(
+            return self._random_source.choice(OUTPUT_REDIRECT_FORMATS).format(
                 command_string,
-                random.choice(self.output_names)
+                self._random_source.choice(self.output_names)
             )
@@ -17,14 +17,12 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with skiddie.  If not, see <http://www.gnu.org/licenses/>.
 """
-import random
-
 from prompt_toolkit.validation import Validator
 from prompt_toolkit import PromptSession
 
 from skiddie.utils.ui import print_correct_message
 from skiddie.constants import GUI_STYLE
-from skiddie.games.shell_scripter.logic import Command, CommandGenerator
+from skiddie.games.shell_scripter.logic import CommandGenerator
 from skiddie.games.shell_scripter.constants import INPUT_FILE_NAMES, OUTPUT_FILE_NAMES, COMMANDS
 
 # The string that is printed before each command and line of user input.
@@ -56,13 +54,18 @@ def play(
         redirect_probability=redirect_probability, pipe_probability=pipe_probability,
     )
 
+    # Generate all the commands up front so that there is no work to do between the user entering one command and the
+    # next one being printed.
+    command_strings = [command_generator.get_random() for _ in range(commands_to_win)]
+
+    # The lambda looks up `command_string` when it is called, so the same validator always checks against the command
+    # currently being prompted for.
+    validator = Validator.from_callable(
+        lambda x: x == command_string, error_message="Commands do not match", move_cursor_to_end=True)
+
     # Print random commands and prompt the user to type them in until they type them in correctly.
-    for _ in range(commands_to_win):
-        command_string = command_generator.get_random()
+    for command_string in command_strings:
         print(COMMAND_PROMPT + command_string)
-
-        validator = Validator.from_callable(
-            lambda x: x == command_string, error_message="Commands do not match", move_cursor_to_end=True)
         session.prompt(COMMAND_PROMPT, validator=validator)
 
         print()
@@ -22,17 +22,19 @@ import click
 from prompt_toolkit import print_formatted_text
 
 from skiddie.constants import DEFAULT_DIFFICULTY
-from skiddie.launcher import gui
 from skiddie.exceptions import MissingConfigKeyError
 from skiddie.launcher.games import Game, GameSession, GAMES
 from skiddie.launcher.scores import process_result, Scores, format_scores, ScoreSort
 
+# A map of the lowercase name of each game to the game.
+_GAMES_BY_NAME = {game.game_name.lower(): game for game in GAMES}
+
 
 def _get_game(name: str) -> Game:
-    """Get a game from its name."""
+    """Get a game from its name, ignoring case."""
     try:
-        return next(item for item in GAMES if item.game_name.lower() == name.lower())
-    except StopIteration:
+        return _GAMES_BY_NAME[name.lower()]
+    except KeyError:
         raise click.BadParameter("'{0}'".format(name))
 
 
@@ -42,6 +44,8 @@ def cli(ctx):
     """Run without any arguments to launch the GUI."""
     # If the command is run without any arguments, options or subcommands, run the GUI launcher.
     if ctx.invoked_subcommand is None:
+        # The GUI is only imported here because it is slow to import and isn't needed by the subcommands.
+        from skiddie.launcher import gui
         gui.main()
 
 
@@ -80,12 +84,14 @@ def description(game: str):
 @click.option("--sort-column", "-s", default="score", show_default=True, help="The column to sort the scores by.")
 def scores(game, difficulty, number, sort_column):
     """Get the high scores of the game named GAME."""
-    score_store = Scores()
-    with score_store:
-        high_scores = score_store.get_scores(_get_game(game), difficulty)[:number]
-
+    # Check the arguments before reading the scores file.
+    selected_game = _get_game(game)
     sort_method = ScoreSort.from_name(sort_column)
     if not sort_method:
         raise click.BadParameter("'{0}'".format(sort_column))
 
+    score_store = Scores()
+    with score_store:
+        high_scores = score_store.get_scores(selected_game, difficulty, limit=number)
+
     print_formatted_text(format_scores(high_scores, sort_method=sort_method))
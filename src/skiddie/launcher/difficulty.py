@@ -19,7 +19,6 @@ along with skiddie.  If not, see <http://www.gnu.org/licenses/>.
 """
 import io
 import json
-import collections
 import os
 from typing import Dict, Any, List
 
@@ -41,11 +40,11 @@ class DifficultyPresets:
         """Read the difficulty presets from storage, getting missing values from the template file."""
         with pkg_resources.resource_stream("skiddie", self._template_path) as binary_stream:
             template_file = io.TextIOWrapper(binary_stream)
-            template_data = json.load(template_file, object_pairs_hook=collections.OrderedDict)
+            template_data = json.load(template_file)
 
         try:
             with open(self._config_path, "r") as config_file:
-                config_data = json.load(config_file, object_pairs_hook=collections.OrderedDict)
+                config_data = json.load(config_file)
         except FileNotFoundError:
             # The config file has not been created yet.
             config_data = {}
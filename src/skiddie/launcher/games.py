@@ -18,11 +18,9 @@ You should have received a copy of the GNU General Public License
 along with skiddie.  If not, see <http://www.gnu.org/licenses/>.
 """
 import datetime
+import importlib
 from typing import Callable
 
-from skiddie.games import (
-    hash_cracker, shell_scripter, port_scanner, hex_editor, pattern_finder, database_querier, tree_builder,
-)
 from skiddie.launcher.difficulty import DifficultyPresets
 from skiddie.utils.misc import get_timer
 from skiddie.utils.ui import get_description
@@ -34,12 +32,19 @@ class Game:
     Attributes:
         game_name: The name of the game.
         description: A description of the game.
-        launcher: A function which starts the game.
+        module_name: The name of the module containing the game. It is not imported until the game is played.
     """
-    def __init__(self, game_name: str, description: str, launcher: Callable[..., None]) -> None:
+    __slots__ = ("game_name", "description", "module_name")
+
+    def __init__(self, game_name: str, description: str, module_name: str) -> None:
         self.game_name = game_name
         self.description = description
-        self._launcher = launcher
+        self.module_name = module_name
+
+    @property
+    def launcher(self) -> Callable[..., None]:
+        """The function which starts the game, importing its module if necessary."""
+        return importlib.import_module(self.module_name).play
 
     def play(self, difficulty: str) -> float:
         """Play the game and return how long it took to complete in seconds.
@@ -51,7 +56,8 @@ class Game:
         with difficulty_store:
             game_args = difficulty_store.get_difficulty_settings(self.game_name, difficulty)
 
-        play_func = get_timer(self._launcher)
+        # Import the game before starting the timer so that the import isn't counted in the user's time.
+        play_func = get_timer(self.launcher)
 
         return play_func(**game_args)
 
@@ -91,13 +97,15 @@ class GameSession:
         self.completed = datetime.datetime.now()
 
 
-GAME_DATABASE_QUERIER = Game("database_querier", get_description("database_querier.md"), database_querier.play)
-GAME_HASH_CRACKER = Game("hash_cracker", get_description("hash_cracker.md"), hash_cracker.play)
-GAME_HEX_EDITOR = Game("hex_editor", get_description("hex_editor.md"), hex_editor.play)
-GAME_PATTERN_FINDER = Game("pattern_finder", get_description("pattern_finder.md"), pattern_finder.play)
-GAME_PORT_SCANNER = Game("port_scanner", get_description("port_scanner.md"), port_scanner.play)
-GAME_SHELL_SCRIPTER = Game("shell_scripter", get_description("shell_scripter.md"), shell_scripter.play)
-GAME_TREE_BUILDER = Game("tree_builder", get_description("tree_builder.md"), tree_builder.play)
+GAME_DATABASE_QUERIER = Game(
+    "database_querier", get_description("database_querier.md"), "skiddie.games.database_querier"
+)
+GAME_HASH_CRACKER = Game("hash_cracker", get_description("hash_cracker.md"), "skiddie.games.hash_cracker")
+GAME_HEX_EDITOR = Game("hex_editor", get_description("hex_editor.md"), "skiddie.games.hex_editor")
+GAME_PATTERN_FINDER = Game("pattern_finder", get_description("pattern_finder.md"), "skiddie.games.pattern_finder")
+GAME_PORT_SCANNER = Game("port_scanner", get_description("port_scanner.md"), "skiddie.games.port_scanner")
+GAME_SHELL_SCRIPTER = Game("shell_scripter", get_description("shell_scripter.md"), "skiddie.games.shell_scripter")
+GAME_TREE_BUILDER = Game("tree_builder", get_description("tree_builder.md"), "skiddie.games.tree_builder")
 
 # A list of all available games. This must be updated whenever new games are added.
 GAMES = [
@@ -18,8 +18,7 @@ You should have received a copy of the GNU General Public License
 along with skiddie.  If not, see <http://www.gnu.org/licenses/>.
 """
 import functools
-import collections
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 from prompt_toolkit import Application
 from prompt_toolkit.layout.containers import VSplit, HSplit
@@ -39,6 +38,12 @@ from skiddie.launcher.scores import process_result, format_scores, Scores, Score
 # The width of buttons that are used to create menus.
 MENU_BUTTON_WIDTH = 20
 
+# The choices of sort method for the high scores, with the label for each.
+SORT_CHOICES = [(sort_method, sort_method.column_name) for sort_method in ScoreSort]
+
+# The games in the order they are listed in the game select menu.
+SORTED_GAMES = sorted(GAMES, key=lambda x: x.game_name)
+
 
 def _create_menu_keybindings(buttons: List[Button]) -> KeyBindings:
     """Create the keybindings for interactive menus."""
@@ -56,6 +61,7 @@ class GameSelectScreen(Screen):
         _game_options_screen: The screen for configuring options for the selected game.
         _game_buttons: A map of buttons to the games they represent. These buttons are used to access the options menu
             for each game.
+        _games_by_window: A map of the window of each button in `_game_buttons` to the game it represents.
 
     """
     def __init__(self, multi_screen: MultiScreenApp) -> None:
@@ -63,15 +69,14 @@ class GameSelectScreen(Screen):
 
         self._game_options_screen = GameOptionsScreen(multi_screen, lambda: self._selected_game)
 
-        self._game_buttons = collections.OrderedDict([(
-                Button(
-                    game.game_name, width=MENU_BUTTON_WIDTH,
-                    handler=functools.partial(self._select_game, game),
-                ),
-                game
-            )
-            for game in sorted(GAMES, key=lambda x: x.game_name)
-        ])
+        self._game_buttons = {
+            Button(
+                game.game_name, width=MENU_BUTTON_WIDTH,
+                handler=functools.partial(self._select_game, game),
+            ): game
+            for game in SORTED_GAMES
+        }
+        self._games_by_window = {button.window: game for button, game in self._game_buttons.items()}
 
         super().__init__(multi_screen)
 
@@ -126,10 +131,9 @@ class GameSelectScreen(Screen):
         Returns:
             The description to display.
         """
-        for key, value in self._game_buttons.items():
-            if self.multi_screen.app.layout.has_focus(key):
-                return value.description
-        return ""
+        # This is called on every redraw, so look up the focused button directly instead of checking each button.
+        game = self._games_by_window.get(self.multi_screen.app.layout.current_window)
+        return "" if game is None else game.description
 
     def _exit(self) -> None:
         """Exit the application."""
@@ -144,7 +148,7 @@ class GameOptionsScreen(Screen):
 
     Attributes:
         _selected_game_getter: A function which returns the game which is currently selected.
-        _selected_difficulties: A map of games to their currently selected difficulties.
+        _selected_difficulties: A map of the names of games to their currently selected difficulties.
         _difficulty_select_screen: The screen used for setting the difficulty of the selected game.
     """
     def __init__(self, multi_screen: MultiScreenApp, selected_game_getter: Callable[[], Game]) -> None:
@@ -152,7 +156,7 @@ class GameOptionsScreen(Screen):
             self._selected_difficulty = value
 
         self._selected_game_getter = selected_game_getter
-        self._selected_difficulties = {game: DEFAULT_DIFFICULTY for game in GAMES}
+        self._selected_difficulties = {game.game_name: DEFAULT_DIFFICULTY for game in GAMES}
 
         self._difficulty_select_screen = DifficultySelectScreen(
             multi_screen, selected_difficulty_setter, selected_game_getter)
@@ -167,11 +171,11 @@ class GameOptionsScreen(Screen):
             Button("Play", width=MENU_BUTTON_WIDTH, handler=self._return_session),
             Button(
                 "Difficulty", width=MENU_BUTTON_WIDTH,
-                handler=lambda: self.multi_screen.add_floating_screen(self._difficulty_select_screen),
+                handler=functools.partial(self.multi_screen.add_floating_screen, self._difficulty_select_screen),
             ),
             Button(
                 "High Scores", width=MENU_BUTTON_WIDTH,
-                handler=lambda: self.multi_screen.set_screen(self._high_score_screen)
+                handler=functools.partial(self.multi_screen.set_screen, self._high_score_screen)
             ),
             HorizontalLine(),
             Button(
@@ -194,7 +198,7 @@ class GameOptionsScreen(Screen):
 
         difficulty_label_container = Box(
             Label(
-                text=lambda: "Difficulty: {0}".format(self._selected_difficulty),
+                text="Difficulty: {0}".format(self._selected_difficulty),
                 width=Dimension(min=40),
             ),
             padding=0,
@@ -232,12 +236,12 @@ class GameOptionsScreen(Screen):
     @property
     def _selected_difficulty(self) -> str:
         """The selected difficulty for the currently selected game."""
-        return self._selected_difficulties[self._selected_game]
+        return self._selected_difficulties[self._selected_game.game_name]
 
     @_selected_difficulty.setter
     def _selected_difficulty(self, value: str) -> None:
         """Set the selected difficulty for the currently selected game."""
-        self._selected_difficulties[self._selected_game] = value
+        self._selected_difficulties[self._selected_game.game_name] = value
 
     @property
     def _selected_game(self) -> Game:
@@ -256,20 +260,34 @@ class DifficultySelectScreen(Screen):
 
     Attributes:
         _selected_difficulty_setter: A function which sets the difficulty for the currently selected game.
+        _difficulty_choices: A map of the names of games to the choices of difficulty for that game, with the label for
+            each. This is filled in as each game is selected so that the presets are only read once per game.
     """
     def __init__(
             self, multi_screen: MultiScreenApp,
             selected_difficulty_setter: Callable[[str], None], selected_game_getter: Callable[[], Game]) -> None:
         self._selected_game_getter = selected_game_getter
         self._selected_difficulty_setter = selected_difficulty_setter
+        self._difficulty_choices = {}
         super().__init__(multi_screen)
 
-    def get_root_container(self) -> Dialog:
+    def _get_difficulty_choices(self, game_name: str) -> List[Tuple[str, str]]:
+        """Get the choices of difficulty for the given game, reading them from the presets the first time."""
+        try:
+            return self._difficulty_choices[game_name]
+        except KeyError:
+            pass
+
         difficulty_store = DifficultyPresets()
         with difficulty_store:
-            difficulty_names = difficulty_store.get_difficulty_names(self._selected_game_getter().game_name)
+            difficulty_names = difficulty_store.get_difficulty_names(game_name)
 
-        difficulty_radiolist = RadioList([(difficulty, difficulty) for difficulty in difficulty_names])
+        choices = [(difficulty, difficulty) for difficulty in difficulty_names]
+        self._difficulty_choices[game_name] = choices
+        return choices
+
+    def get_root_container(self) -> Dialog:
+        difficulty_radiolist = RadioList(self._get_difficulty_choices(self._selected_game_getter().game_name))
 
         def ok_handler() -> None:
             self._selected_difficulty_setter(difficulty_radiolist.current_value)
@@ -329,7 +347,7 @@ class HighScoreScreen(Screen):
         buttons = [
             Button(
                 "Sort By", width=MENU_BUTTON_WIDTH,
-                handler=lambda: self.multi_screen.add_floating_screen(self._sort_select_screen),
+                handler=functools.partial(self.multi_screen.add_floating_screen, self._sort_select_screen),
             ),
             HorizontalLine(),
             Button("Back", width=MENU_BUTTON_WIDTH, handler=self.multi_screen.set_previous),
@@ -349,7 +367,7 @@ class HighScoreScreen(Screen):
 
         difficulty_label_container = Box(
             Label(
-                text=lambda: "Difficulty: {0}".format(self._selected_difficulty),
+                text="Difficulty: {0}".format(self._selected_difficulty),
                 width=Dimension(min=40),
             ),
             padding=0,
@@ -410,9 +428,7 @@ class SortSelectScreen(Screen):
         super().__init__(multi_screen)
 
     def get_root_container(self) -> Dialog:
-        sort_radiolist = RadioList([
-            (sort_method, sort_method.column_name) for sort_method in ScoreSort
-        ])
+        sort_radiolist = RadioList(SORT_CHOICES)
 
         def ok_handler() -> None:
             self._selected_sort_setter(sort_radiolist.current_value)
@@ -20,6 +20,7 @@ along with skiddie.  If not, see <http://www.gnu.org/licenses/>.
 import enum
 import os
 import json
+import heapq
 import getpass
 import datetime
 from typing import List, Optional, Union, Callable, Any, Dict
@@ -104,9 +105,17 @@ class Scores:
             .setdefault(difficulty, [])
             .append(new_score))
 
-    def get_scores(self, game: Game, difficulty: str, sort: bool = True) -> List[GameSession]:
+    def get_scores(
+            self, game: Game, difficulty: str, sort: bool = True, limit: Optional[int] = None) -> List[GameSession]:
         """Return a list of scores from the given game on the given difficulty.
 
+        Args:
+            game: The game to get the scores of.
+            difficulty: The difficulty to get the scores of.
+            sort: Sort the scores from best to worst time.
+            limit: Only return this many of the scores with the best times, sorted from best to worst. If None, return
+                every score.
+
         Returns:
             A list of sessions of games.
         """
@@ -130,6 +139,10 @@ class Scores:
             for score in difficulty_data
         ]
 
+        if limit is not None:
+            # This only partially sorts the scores, which is faster than sorting all of them when few are needed.
+            return heapq.nsmallest(limit, scores, key=lambda x: x.duration)
+
         if sort:
             scores.sort(key=lambda x: x.duration)
 
@@ -142,7 +155,7 @@ class Scores:
             The session for the game with the high score or None if there are no scores.
         """
         try:
-            return self.get_scores(game, difficulty, sort=True)[0]
+            return self.get_scores(game, difficulty, limit=1)[0]
         except IndexError:
             # There are no scores for the given game and difficulty.
             return None
@@ -165,10 +178,16 @@ class ScoreSort(enum.Enum):
 
     @classmethod
     def from_name(cls, name: str) -> "ScoreSort":
-        """Get a ScoreSort instance from its column name."""
-        for difficulty in cls:
-            if difficulty.name.lower() == name.lower():
-                return difficulty
+        """Get a ScoreSort instance from its name, ignoring case.
+
+        Returns:
+            The matching ScoreSort instance or None if there is none.
+        """
+        return _SCORE_SORTS_BY_NAME.get(name.lower())
+
+
+# A map of the lowercase name of each ScoreSort instance to the instance.
+_SCORE_SORTS_BY_NAME = {sort_method.name.lower(): sort_method for sort_method in ScoreSort}
 
 
 def format_scores(
@@ -25,6 +25,11 @@ from typing import Sequence, Iterator, List, TypeVar, Union, Tuple
 T = TypeVar("T")
 
 
+def count_bits(mask: int) -> int:
+    """Return the number of bits which are set in the given non-negative integer."""
+    return bin(mask).count("1")
+
+
 def get_random_cycle(sequence: Sequence[T]) -> Iterator[T]:
     """Return a randomized cycle of the given sequence."""
     random_sequence = list(sequence)
@@ -22,6 +22,9 @@ from typing import MutableMapping, Mapping, Callable, TypeVar
 
 T = TypeVar("T")
 
+# The number of nanoseconds in a second.
+NANOSECONDS_PER_SECOND = 1e9
+
 
 def recursive_update(update: MutableMapping, other: Mapping) -> MutableMapping:
     """Recursively update `update` with values from `other`, overwriting existing keys."""
@@ -62,11 +65,11 @@ def get_timer(func: Callable) -> Callable[..., float]:
         A function which returns the number of seconds that the given function took to execute.
     """
     def timer(*args, **kwargs) -> float:
-        start_time = time.monotonic()
+        start_time = time.monotonic_ns()
         func(*args, **kwargs)
-        end_time = time.monotonic()
+        end_time = time.monotonic_ns()
 
-        elapsed_time = end_time - start_time
+        elapsed_time = (end_time - start_time) / NANOSECONDS_PER_SECOND
 
         return elapsed_time
 